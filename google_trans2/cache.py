@@ -0,0 +1,56 @@
+import copy
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+class ResultCache:
+    """
+    Keeps `translate` and `detect` results, either as an in-memory LRU or in a
+    `diskcache.Cache` when given a directory. It holds no reference to the client
+    that uses it, and values are copied in and out so callers can't mutate them.
+    """
+
+    def __init__(self, maxsize: int = 10_000, directory: Optional[str] = None):
+        self.maxsize = maxsize
+        self._disk = None
+        if directory is not None:
+            if diskcache is None:
+                raise ImportError(
+                    "cache_dir requires diskcache, install it with `pip install google-trans2[cache]`"
+                )
+            self._disk = diskcache.Cache(directory)
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        """Returns the cached value for `key`, or None if there isn't one."""
+        if self._disk is not None:
+            return self._disk.get(key)
+        with self._lock:
+            value = self._memory.get(key)
+            if value is None:
+                return None
+            self._memory.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: tuple, value):
+        """Stores `value` under `key`. None is never stored, so failures are retried."""
+        if value is None:
+            return
+        if self._disk is not None:
+            self._disk.set(key, value)
+            return
+        if self.maxsize <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
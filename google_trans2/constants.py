@@ -2,6 +2,10 @@ import re
 
 GOOGLE_TTS_RPC = ["MkEWBc"]
 
+# Joins texts in `translate_batch`, invisible separators rarely get translated away
+BATCH_SEPARATOR = "\n\u2063\u2063\u2063\n"
+BATCH_MAX_CHARS = 4500
+
 
 LANGUAGES = {
     "auto": "auto",
@@ -17,8 +17,10 @@ class GoogleTranslateError(Exception):
             premise = "Failed to connect"
             return f"{premise}. Probable cause: timeout"
 
-        status = rsp.status_code
-        reason = rsp.reason
+        # requests and httpx expose `status_code`, aiohttp exposes `status`
+        status = getattr(rsp, "status_code", None) or rsp.status
+        # requests exposes `reason`, httpx exposes `reason_phrase`
+        reason = getattr(rsp, "reason", None) or getattr(rsp, "reason_phrase", "")
 
         premise = f"{status} ({reason}) from TTS API"
 
@@ -1,23 +1,212 @@
+import re
 import json
+import asyncio
+import logging
 import random
+import time
 import urllib3
 import requests as rq
-from loguru import logger
 from typing import Optional
-from urllib.parse import quote
+from urllib.parse import quote_from_bytes
+from urllib3.util import Retry
+from requests.adapters import HTTPAdapter
 
 
 from .uas import USER_AGENTS
+from .cache import ResultCache
 from .exceptions import GoogleTranslateError
-from .constants import GOOGLE_TTS_RPC, LANGUAGES, URL_SUFFIX_DEFAULT, URLS_SUFFIX
+from .constants import (
+    BATCH_MAX_CHARS,
+    BATCH_SEPARATOR,
+    GOOGLE_TTS_RPC,
+    LANGUAGES,
+    URL_SUFFIX_DEFAULT,
+    URLS_SUFFIX,
+)
 
+logger = logging.getLogger(__name__)
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumpb = orjson.dumps
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def _json_dumpb(obj) -> bytes:
+        return _json_dumps(obj).encode()
+
+
+# The f.req envelope only varies by the encoded parameter, so it is encoded once
+# per RPC id and the parameter is spliced into the placeholder per request.
+_RPC_PLACEHOLDER = b'"__INNER__"'
+_RPC_TEMPLATES = {
+    rpc: _json_dumpb([[[rpc, "__INNER__", None, "generic"]]]) for rpc in GOOGLE_TTS_RPC
+}
+
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+_LANG_SET = frozenset(LANGUAGES)
+
+DEFAULT_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
+}
+
+_CHUNK_SIZE = 8192
+
+# Shared by the requests adapter and the httpx backend
+_RETRY_TOTAL = 2
+_RETRY_BACKOFF = 0.1
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+_BATCH_SPLIT = re.compile(r"\s*\u2063+\s*")
+
+_JSON_TOKEN = re.compile(rb'[\[\],"]')
+_JSON_STRING_TOKEN = re.compile(rb'[\\"]')
+_JSON_WHITESPACE = b" \t\r\n"
+
+
+def _skip_json_string(buf: bytes, pos: int) -> int:
+    """Returns the index just past the JSON string literal opening at `pos`."""
+    pos += 1
+    while True:
+        m = _JSON_STRING_TOKEN.search(buf, pos)
+        if m is None:
+            raise ValueError("Unterminated JSON string")
+        if buf[m.start()] == 0x22:  # '"'
+            return m.end()
+        pos = m.end() + 1  # skip the escaped character
+
+
+def _pack_batch(items: list[tuple[int, str]]):
+    """
+    Greedily groups `(index, text)` items into chunks whose joined text stays
+    within BATCH_MAX_CHARS.
+    """
+    chunk, size = [], 0
+    for item in items:
+        length = len(item[1])
+        if chunk and size + len(BATCH_SEPARATOR) + length > BATCH_MAX_CHARS:
+            yield chunk
+            chunk, size = [], 0
+        size += length + (len(BATCH_SEPARATOR) if chunk else 0)
+        chunk.append(item)
+    if chunk:
+        yield chunk
+
+
+def _json_element(buf: bytes, path: tuple) -> bytes:
+    """
+    Returns the raw bytes of the element at `path` inside a JSON array,
+    without decoding anything around it. E.g. path (0, 2) is `arr[0][2]`.
+    Whitespace around elements is skipped, so compact and spaced JSON both work.
+    """
+    start, end = 0, len(buf)
+    for target in path:
+        if buf[start : start + 1] != b"[":
+            raise ValueError(f"Expected a JSON array at offset {start}")
+        pos = start + 1
+        start = pos
+        depth = 0
+        index = 0
+        while True:
+            m = _JSON_TOKEN.search(buf, pos, end)
+            if m is None:
+                raise ValueError("Unterminated JSON array")
+            ch = buf[m.start()]
+            if ch == 0x22:  # '"'
+                pos = _skip_json_string(buf, m.start())
+                continue
+            pos = m.end()
+            if ch == 0x5B:  # '['
+                depth += 1
+            elif depth > 0:
+                if ch == 0x5D:  # ']'
+                    depth -= 1
+            elif index == target:  # ',' or ']' closing the target element
+                end = m.start()
+                break
+            elif ch == 0x5D:
+                raise IndexError(f"JSON array index {target} out of range")
+            else:
+                index += 1
+                start = pos
+        while start < end and buf[start] in _JSON_WHITESPACE:
+            start += 1
+        while end > start and buf[end - 1] in _JSON_WHITESPACE:
+            end -= 1
+        if start == end:  # `[]`, the array has no elements at all
+            raise IndexError(f"JSON array index {target} out of range")
+    return buf[start:end]
+
+
+# Where the fields live in the decoded payload. `_parse_response` is generated
+# from these at import time, so the index chains are inlined as constants.
+_TRANSLATIONS_PATH = (1, 0)
+_PRONOUNCE_SRC_PATH = (0, 0)
+_PRONOUNCE_TGT_PATH = (1, 0, 0, 1)
+_SENTENCES_INDEX = 5
+
+
+def _index_expr(name: str, path: tuple) -> str:
+    return name + "".join(f"[{i}]" for i in path)
+
+
+_PARSER_SOURCE = f"""
+def _parse_response(inner, pronounce):
+    translations = {_index_expr("inner", _TRANSLATIONS_PATH)}
+    if len(translations) == 1:
+        first = translations[0]
+        if len(first) <= {_SENTENCES_INDEX}:  # only url
+            return first[0], None, None
+        text = " ".join(sentence[0].strip() for sentence in first[{_SENTENCES_INDEX}])
+    elif len(translations) == 2:
+        text = [translation[0] for translation in translations]
+    else:
+        return None
+    if not pronounce:
+        return text, None, None
+    return (
+        text,
+        {_index_expr("inner", _PRONOUNCE_SRC_PATH)},
+        {_index_expr("inner", _PRONOUNCE_TGT_PATH)},
+    )
+"""
+_parser_namespace = {}
+exec(compile(_PARSER_SOURCE, "<google_trans2 response parser>", "exec"), _parser_namespace)
+_parse_response = _parser_namespace["_parse_response"]
 
 
 class GoogleTranslate:
     def __init__(
-        self, url_suffix: str = "com", timeout: int = 5, proxies: Optional[dict] = None
+        self,
+        url_suffix: str = "com",
+        timeout: int = 5,
+        proxies: Optional[dict] = None,
+        pool_size: int = 32,
+        http2: bool = False,
+        cache_size: int = 10_000,
+        cache_dir: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        verify: bool = True,
     ):
         """
         Initializes the translation client with the specified settings.
@@ -30,6 +219,21 @@ class GoogleTranslate:
             proxies (Optional[dict], optional): A dictionary of proxies to use for the translation requests.
                                                 Format: {'http': 'http://ip:host', 'https': 'http://ip:host'}.
                                                 Defaults to None if no proxy is to be used.
+            pool_size (int, optional): The number of keep-alive connections kept per host, size it to the
+                                       expected number of concurrent requests. Defaults to 32.
+            http2 (bool, optional): If True, sends requests through an HTTP/2 `httpx` client so concurrent
+                                    requests share one connection. Retries like the default backend.
+                                    Requires the `http2` extra.
+                                    Defaults to False.
+            cache_size (int, optional): The number of `translate` and `detect` results kept in memory,
+                                        0 disables caching. Defaults to 10000.
+            cache_dir (Optional[str], optional): A directory for a persistent `diskcache` cache used instead
+                                                 of the in-memory one, so results survive restarts.
+                                                 Requires the `cache` extra. Defaults to None.
+            user_agent (Optional[str], optional): The User-Agent sent with every request, pin it for
+                                                  reproducible debugging. Defaults to None, which picks
+                                                  one at random from `uas.USER_AGENTS`.
+            verify (bool, optional): Whether to verify the server's TLS certificate. Defaults to True.
 
         """
         self.proxies = {} if proxies is None else proxies
@@ -40,32 +244,164 @@ class GoogleTranslate:
         self.base_url = f"https://translate.google.{self.url_suffix}"
         self.url = self.base_url + "/_/TranslateWebserverUi/data/batchexecute"
         self.timeout = timeout
+        self.user_agent = (
+            random.choice(USER_AGENTS) if user_agent is None else user_agent
+        )
+        self.headers = {
+            **DEFAULT_HEADERS,
+            "Referer": self.base_url,
+            "User-Agent": self.user_agent,
+        }
+        self.pool_size = pool_size
+        self.verify = verify
+        if not verify:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
         self.session = rq.Session()
-        self.session.verify = False
+        self.session.verify = self.verify
         self.session.proxies = self.proxies
-        self.session.headers = self._rq_headers()
+        self.session.headers = dict(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=_RETRY_TOTAL,
+                backoff_factor=_RETRY_BACKOFF,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
 
-    def _rq_headers(self):
-        return {
-            "Referer": self.base_url,
-            "User-Agent": random.choice(USER_AGENTS),
-            "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
-        }
+        self._client = None
+        if http2:
+            if httpx is None:
+                raise ImportError(
+                    "http2=True requires httpx, install it with `pip install google-trans2[http2]`"
+                )
+            # Connection failures are retried by the transport, 5xx responses in `_post`
+            transport = httpx.HTTPTransport(
+                http2=True,
+                verify=self.verify,
+                proxy=self.proxies.get("https"),
+                limits=httpx.Limits(
+                    max_keepalive_connections=pool_size,
+                    max_connections=2 * pool_size,
+                ),
+                retries=_RETRY_TOTAL,
+            )
+            self._client = httpx.Client(
+                transport=transport,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
+        self._rpc_marker_bytes = GOOGLE_TTS_RPC[0].encode()
+
+        self._cache = ResultCache(maxsize=cache_size, directory=cache_dir)
 
     def _f_req_data(self, text: str, src_lang: str = "auto", tgt_lang: str = "auto"):
-        parameter = [[text.strip(), src_lang, tgt_lang, True], [1]]
-        escaped_parameter = json.dumps(parameter, separators=(",", ":"))
-        rpc = [[[random.choice(GOOGLE_TTS_RPC), escaped_parameter, None, "generic"]]]
-        espaced_rpc = json.dumps(rpc, separators=(",", ":"))
-        f_req = "f.req={}&".format(quote(espaced_rpc))
+        parameter = [[text, src_lang, tgt_lang, True], [1]]
+        escaped_parameter = _json_dumpb(_json_dumps(parameter))
+        espaced_rpc = _RPC_TEMPLATES[random.choice(GOOGLE_TTS_RPC)].replace(
+            _RPC_PLACEHOLDER, escaped_parameter
+        )
+        f_req = b"f.req=" + quote_from_bytes(espaced_rpc, safe="").encode() + b"&"
         return f_req
 
+    def _post(self, data: bytes) -> bytes | None:
+        if self._client is None:
+            with self.session.post(
+                url=self.url, data=data, timeout=self.timeout, stream=True
+            ) as r:
+                if r.status_code >= 400:
+                    raise GoogleTranslateError(tts=self, response=r)
+                return self._read_rpc_line(r.iter_content(chunk_size=_CHUNK_SIZE))
+        # Surface httpx failures as the requests exceptions callers already handle
+        try:
+            for attempt in range(_RETRY_TOTAL + 1):
+                with self._client.stream("POST", self.url, content=data) as r:
+                    retry = r.status_code in _RETRY_STATUSES and attempt < _RETRY_TOTAL
+                    if not retry:
+                        if r.status_code >= 400:
+                            raise GoogleTranslateError(tts=self, response=r)
+                        return self._read_rpc_line(
+                            r.iter_bytes(chunk_size=_CHUNK_SIZE)
+                        )
+                time.sleep(_RETRY_BACKOFF * 2**attempt)
+        except httpx.ConnectTimeout as e:
+            raise rq.exceptions.ConnectTimeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise rq.exceptions.RequestException(str(e)) from e
+
+    def _read_rpc_line(self, chunks) -> bytes | None:
+        """
+        Scans the response as it streams in and returns the RPC line once it is complete.
+        Everything up to the end of that line is buffered, the trailing frames after it are
+        read but discarded so the connection goes back to the pool.
+        Returns None if the RPC line never showed up.
+        """
+        marker = self._rpc_marker_bytes
+        buf = bytearray()
+        found = -1
+        line = None
+        for chunk in chunks:
+            if line is not None:
+                continue
+            scanned = len(buf)
+            buf += chunk
+            if found == -1:
+                found = buf.find(marker, max(0, scanned - len(marker) + 1))
+                if found == -1:
+                    continue
+            end = buf.find(b"\n", max(found, scanned))
+            if end != -1:
+                line = bytes(buf[buf.rfind(b"\n", 0, found) + 1 : end])
+        if line is None and found != -1:  # the body ended without a newline
+            line = bytes(buf[buf.rfind(b"\n", 0, found) + 1 :])
+        return line
+
+    def _rpc_line(self, body: bytes) -> bytes | None:
+        marker = body.find(self._rpc_marker_bytes)
+        if marker == -1:
+            return None
+        start = body.rfind(b"\n", 0, marker) + 1
+        end = body.find(b"\n", marker)
+        if end == -1:
+            end = len(body)
+        return body[start:end]
+
+    def _extract_inner_payload(self, line: bytes | None) -> bytes | None:
+        # The RPC line is `[["wrb.fr","<rpc id>","<payload>",...],...]`, only the
+        # quoted payload is needed so slice it out rather than decoding the envelope.
+        if line is None:
+            return None
+        return _json_element(line, (0, 2))
+
+    def _parse_translation(self, payload: bytes, pronounce: bool = False):
+        parsed = _parse_response(_json_loads(_json_loads(payload)), pronounce)
+        if parsed is None:
+            return None
+        if not pronounce:
+            return parsed[0]
+        return list(parsed)
+
+    def _check_text(self, text: str, action: str) -> bool:
+        if len(text) >= 5000:
+            logger.warning(
+                f"GoogleTranslate can only {action} text with less than 5000 characters"
+            )
+            return False
+        if len(text) == 0:
+            logger.warning(f"Nothing to {action}: {len(text)=}")
+            return False
+        return True
+
     def _process_lang(self, lang):
         if lang == "auto":
             return lang
 
-        if lang in LANGUAGES.keys():
+        if lang in _LANG_SET:
             return lang
         else:
             logger.warning(f"{lang=} not supported, will default to 'auto'")
@@ -96,72 +432,165 @@ class GoogleTranslate:
                 - If `pronounce` is True, returns a list containing the translated text and its pronunciation if its available.
                 - Returns None if the translation fails or no text is provided.
         """
-        text = str(text)
-        if len(text) >= 5000:
-            logger.warning(
-                "GoogleTranslate can only translate text with less than 5000 characters"
-            )
-            return
-        if len(text) == 0:
-            logger.warning(f"Nothing to translate: {len(text)=}")
-            return ""
+        text = str(text).strip()
+        if not self._check_text(text, action="translate"):
+            return "" if len(text) == 0 else None
 
         src_lang = self._process_lang(lang=source_lang)
         tgt_lang = self._process_lang(lang=target_lang)
-        f_req_data = self._f_req_data(text=text, src_lang=src_lang, tgt_lang=tgt_lang)
+        key = ("translate", text, src_lang, tgt_lang, pronounce)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._translate(text, src_lang, tgt_lang, pronounce)
+            self._cache.set(key, result)
+        return result
 
+    def _translate(
+        self, text: str, src_lang: str, tgt_lang: str, pronounce: bool
+    ) -> str | list | None:
+        f_req_data = self._f_req_data(text=text, src_lang=src_lang, tgt_lang=tgt_lang)
         try:
-            r = self.session.post(url=self.url, data=f_req_data, timeout=self.timeout)
-            for line in r.iter_lines(chunk_size=1024):
-                decoded_line = line.decode("utf-8")
-                if GOOGLE_TTS_RPC[0] in decoded_line:
-                    try:
-                        response = list(json.loads(decoded_line))
-                        response = list(response)
-                        response = json.loads(response[0][2])
-                        response_ = list(response)
-                        response = response_[1][0]
-                        if len(response) == 1:
-                            if len(response[0]) > 5:
-                                sentences = response[0][5]
-                            else:  ## only url
-                                sentences = response[0][0]
-                                if pronounce:
-                                    return [sentences, None, None]
-                                return sentences
-
-                            translate_text = ""
-                            for sentence in sentences:
-                                sentence = sentence[0]
-                                translate_text += sentence.strip() + " "
-                            if not pronounce:
-                                return translate_text
-                            pronounce_src = response_[0][0]
-                            pronounce_tgt = response_[1][0][0][1]
-                            return [translate_text, pronounce_src, pronounce_tgt]
-                        elif len(response) == 2:
-                            sentences = []
-                            for i in response:
-                                sentences.append(i[0])
-                            if not pronounce:
-                                return sentences
-                            pronounce_src = response_[0][0]
-                            pronounce_tgt = response_[1][0][0][1]
-                            return [sentences, pronounce_src, pronounce_tgt]
-                    except Exception as e:
-                        raise e
-            r.raise_for_status()
+            payload = self._extract_inner_payload(self._post(f_req_data))
         except rq.exceptions.ConnectTimeout as e:
             # logger.debug(str(e))
             raise e
-        except rq.exceptions.HTTPError as e:
-            # Request successful, bad response
-            # logger.debug(str(e))
-            raise GoogleTranslateError(tts=self, response=r)
         except rq.exceptions.RequestException as e:
             # Request failed
             # logger.debug(str(e))
             raise GoogleTranslateError(tts=self)
+        if payload is not None:
+            return self._parse_translation(payload, pronounce=pronounce)
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str = "auto",
+        target_lang: str = "auto",
+    ) -> list:
+        """
+        Translates several texts with as few requests as possible by joining them with an invisible
+        separator, up to about 4500 characters per request.
+
+        Args:
+            texts (list[str]): The texts to be translated.
+            source_lang (str, optional): The source language code, see `translate`. Defaults to 'auto'.
+            target_lang (str, optional): The target language code, see `translate`. Defaults to 'auto'.
+
+        Returns:
+            list: The translated text for each text, in the same order as `texts`.
+                  Empty or whitespace-only texts come back as "" without being sent.
+                  Chunks whose separators don't survive translation are retried one text at a time.
+        """
+        texts = [str(text).strip() for text in texts]
+        results = [""] * len(texts)
+        items = [(i, text) for i, text in enumerate(texts) if text]
+        for chunk in _pack_batch(items):
+            if len(chunk) > 1:
+                translated = self.translate(
+                    BATCH_SEPARATOR.join(text for _, text in chunk),
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                )
+                if isinstance(translated, str):
+                    parts = _BATCH_SPLIT.split(translated.strip())
+                    if len(parts) == len(chunk):
+                        for (i, _), part in zip(chunk, parts):
+                            results[i] = part
+                        continue
+            for i, text in chunk:
+                results[i] = self.translate(
+                    text, source_lang=source_lang, target_lang=target_lang
+                )
+        return results
+
+    async def translate_many(
+        self,
+        texts: list[str],
+        source_lang: str = "auto",
+        target_lang: str = "auto",
+        pronounce: bool = False,
+        max_concurrency: int = 8,
+    ) -> list:
+        """
+        Translates several texts concurrently on the running event loop. Requires the `async` extra.
+        Results are shared with the `translate` cache, so cached texts are not requested again.
+
+        Args:
+            texts (list[str]): The texts to be translated.
+            source_lang (str, optional): The source language code, see `translate`. Defaults to 'auto'.
+            target_lang (str, optional): The target language code, see `translate`. Defaults to 'auto'.
+            pronounce (bool, optional): If True, each result includes pronunciations, see `translate`.
+                                        Defaults to False.
+            max_concurrency (int, optional): The maximum number of requests in flight at once,
+                                             keep it low to avoid being rate limited. Defaults to 8.
+
+        Returns:
+            list: The result of `translate` for each text, in the same order as `texts`.
+                  A text that failed holds its exception (usually a `GoogleTranslateError`)
+                  instead, so one failure doesn't discard the other results.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "translate_many requires aiohttp, install it with `pip install google-trans2[async]`"
+            )
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit=self.pool_size, ssl=self.verify)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as session:
+            return await asyncio.gather(
+                *[
+                    self._atranslate(
+                        session,
+                        semaphore,
+                        text,
+                        source_lang=source_lang,
+                        target_lang=target_lang,
+                        pronounce=pronounce,
+                    )
+                    for text in texts
+                ],
+                return_exceptions=True,
+            )
+
+    async def _atranslate(
+        self,
+        session,
+        semaphore: asyncio.Semaphore,
+        text: str,
+        source_lang: str = "auto",
+        target_lang: str = "auto",
+        pronounce: bool = False,
+    ) -> str | list | None:
+        text = str(text).strip()
+        if not self._check_text(text, action="translate"):
+            return "" if len(text) == 0 else None
+
+        src_lang = self._process_lang(lang=source_lang)
+        tgt_lang = self._process_lang(lang=target_lang)
+        key = ("translate", text, src_lang, tgt_lang, pronounce)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        f_req_data = self._f_req_data(text=text, src_lang=src_lang, tgt_lang=tgt_lang)
+        async with semaphore:
+            try:
+                async with session.post(
+                    self.url, data=f_req_data, proxy=self.proxies.get("https")
+                ) as r:
+                    if r.status >= 400:
+                        raise GoogleTranslateError(tts=self, response=r)
+                    body = await r.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise GoogleTranslateError(tts=self) from e
+        payload = self._extract_inner_payload(self._rpc_line(body))
+        if payload is not None:
+            result = self._parse_translation(payload, pronounce=pronounce)
+            self._cache.set(key, result)
+        return result
 
     def detect(self, text: str) -> dict | None:
         """
@@ -177,35 +606,30 @@ class GoogleTranslate:
                 Example: {"en": "english"}.
                 - Returns None if the language detection fails or if no text is provided.
         """
-        if len(text) >= 5000:
-            logger.warning(
-                "GoogleTranslate can only detect text with less than 5000 characters"
-            )
-            return
-        if len(text) == 0:
-            logger.warning(f"Nothing to detact: {len(text)=}")
+        text = text.strip()
+        if not self._check_text(text, action="detect"):
             return
 
+        key = ("detect", text)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._detect(text)
+            self._cache.set(key, result)
+        return result
+
+    def _detect(self, text: str) -> dict | None:
         f_req_data = self._f_req_data(text)
         try:
-            r = self.session.post(url=self.url, data=f_req_data, timeout=self.timeout)
-
-            for line in r.iter_lines(chunk_size=1024):
-                decoded_line = line.decode("utf-8")
-                if GOOGLE_TTS_RPC[0] in decoded_line:
-                    try:
-                        response = json.loads(decoded_line)
-                        response = json.loads(response[0][2])
-                        detected_lang = response[0][2]
-                        detected_lang = detected_lang.lower()
-                    except Exception as e:
-                        raise e
-                    return {detected_lang: LANGUAGES[detected_lang]}
-            r.raise_for_status()
-        except rq.exceptions.HTTPError as e:
-            # Request successful, bad response
-            # logger.debug(str(e))
-            raise GoogleTranslateError(tts=self, response=r)
+            payload = self._extract_inner_payload(self._post(f_req_data))
+            if payload is not None:
+                try:
+                    # Only [0][2] is needed, slice it out instead of decoding the translation
+                    response = _json_loads(payload).encode()
+                    detected_lang = _json_loads(_json_element(response, (0, 2)))
+                    detected_lang = detected_lang.lower()
+                except Exception as e:
+                    raise e
+                return {detected_lang: LANGUAGES[detected_lang]}
         except rq.exceptions.RequestException as e:
             # Request failed
             # logger.debug(str(e))
@@ -0,0 +1,28 @@
+import json
+
+import pytest
+
+
+def _rpc_body(inner) -> bytes:
+    """Builds a batchexecute response body whose RPC payload decodes to `inner`."""
+    envelope = [["wrb.fr", "MkEWBc", json.dumps(inner), None, None, None, "generic"]]
+    line = json.dumps(envelope, separators=(",", ":"))
+    return f')]}}\'\n\n{len(line)}\n{line}\n25\n[["di",40],["af.httprm",40]]\n'.encode()
+
+
+def _sentences_inner(*sentences, pronounce_src=None, pronounce_tgt=None):
+    """A decoded payload in the usual shape: one translation made of `sentences`."""
+    return [
+        [pronounce_src, None, "en"],
+        [[[None, pronounce_tgt, None, None, None, [[s, None] for s in sentences]]], "fr"],
+    ]
+
+
+@pytest.fixture
+def rpc_body():
+    return _rpc_body
+
+
+@pytest.fixture
+def sentences_inner():
+    return _sentences_inner
@@ -0,0 +1,83 @@
+import gc
+import weakref
+
+import pytest
+
+from google_trans2 import GoogleTranslate
+
+
+def _counting_post(g, body):
+    """Stands in for `_post`, answering every request with `body`."""
+    calls = []
+
+    def post(data):
+        calls.append(data)
+        return g._read_rpc_line([body])
+
+    return post, calls
+
+
+def test_repeated_translate_is_cached(rpc_body, sentences_inner):
+    g = GoogleTranslate()
+    g._post, calls = _counting_post(g, rpc_body(sentences_inner("Bonjour")))
+    assert g.translate("Hello", target_lang="fr") == "Bonjour"
+    assert g.translate("Hello", target_lang="fr") == "Bonjour"
+    assert len(calls) == 1
+
+
+def test_none_results_are_not_cached():
+    g = GoogleTranslate()
+    g._post, calls = _counting_post(g, b"garbage")
+    assert g.translate("abc") is None
+    assert g.translate("abc") is None
+    assert g.detect("abc") is None
+    assert g.detect("abc") is None
+    assert len(calls) == 4
+
+
+def test_cached_results_are_copies(rpc_body, sentences_inner):
+    g = GoogleTranslate()
+    g._post, _ = _counting_post(
+        g,
+        rpc_body(sentences_inner("Bonjour", pronounce_src="src", pronounce_tgt="tgt")),
+    )
+    first = g.translate("Hello", target_lang="fr", pronounce=True)
+    first.append("mutated")
+    assert g.translate("Hello", target_lang="fr", pronounce=True) == [
+        "Bonjour",
+        "src",
+        "tgt",
+    ]
+
+
+def test_cache_size_zero_disables_caching(rpc_body, sentences_inner):
+    g = GoogleTranslate(cache_size=0)
+    g._post, calls = _counting_post(g, rpc_body(sentences_inner("Bonjour")))
+    g.translate("Hello", target_lang="fr")
+    g.translate("Hello", target_lang="fr")
+    assert len(calls) == 2
+
+
+def test_client_is_freed_without_the_cyclic_gc():
+    gc.disable()
+    try:
+        g = GoogleTranslate()
+        ref = weakref.ref(g)
+        del g
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_disk_cache_skips_none_and_persists(tmp_path, rpc_body, sentences_inner):
+    pytest.importorskip("diskcache")
+    g = GoogleTranslate(cache_dir=str(tmp_path))
+    g._post, calls = _counting_post(g, b"garbage")
+    assert g.translate("Hello", target_lang="fr") is None
+    g._post, calls = _counting_post(g, rpc_body(sentences_inner("Bonjour")))
+    assert g.translate("Hello", target_lang="fr") == "Bonjour"
+
+    fresh = GoogleTranslate(cache_dir=str(tmp_path))
+    fresh._post, fresh_calls = _counting_post(fresh, b"garbage")
+    assert fresh.translate("Hello", target_lang="fr") == "Bonjour"
+    assert len(calls) == 1 and len(fresh_calls) == 0
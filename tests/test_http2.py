@@ -0,0 +1,46 @@
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from google_trans2 import GoogleTranslate
+from google_trans2.exceptions import GoogleTranslateError
+
+
+def _client(statuses, body):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        return httpx.Response(status, content=body if status == 200 else b"")
+
+    return httpx.Client(transport=httpx.MockTransport(handler)), calls
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr("google_trans2.translate.time.sleep", lambda _: None)
+
+
+def test_retries_5xx(rpc_body, sentences_inner):
+    g = GoogleTranslate(http2=True)
+    g._client, calls = _client([503, 502, 200], rpc_body(sentences_inner("Bonjour")))
+    assert g.translate("Hello", target_lang="fr") == "Bonjour"
+    assert len(calls) == 3
+
+
+def test_gives_up_after_retries(rpc_body, sentences_inner):
+    g = GoogleTranslate(http2=True)
+    g._client, calls = _client([503], rpc_body(sentences_inner("Bonjour")))
+    with pytest.raises(GoogleTranslateError):
+        g.translate("Hello", target_lang="fr")
+    assert len(calls) == 3
+
+
+def test_does_not_retry_4xx(rpc_body, sentences_inner):
+    g = GoogleTranslate(http2=True)
+    g._client, calls = _client([403], rpc_body(sentences_inner("Bonjour")))
+    with pytest.raises(GoogleTranslateError):
+        g.translate("Hello", target_lang="fr")
+    assert len(calls) == 1
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from google_trans2.translate import _json_element
+
+
+def test_first_level_element():
+    assert _json_element(b'[1,"two",null]', (1,)) == b'"two"'
+
+
+def test_escaped_quotes_and_brackets_in_strings():
+    buf = json.dumps(['a"],[b', "c\\", "x]y", 4], separators=(",", ":")).encode()
+    assert json.loads(_json_element(buf, (0,))) == 'a"],[b'
+    assert json.loads(_json_element(buf, (1,))) == "c\\"
+    assert _json_element(buf, (3,)) == b"4"
+
+
+def test_nested_array_as_target():
+    assert _json_element(b'[1,[2,[3,"]"]],4]', (1,)) == b'[2,[3,"]"]]'
+
+
+def test_nested_path():
+    assert _json_element(b'[[null,null,"en"],[[["hi"]]]]', (0, 2)) == b'"en"'
+    assert _json_element(b'[[null,null,"en"],[[["hi"]]]]', (1, 0, 0, 0)) == b'"hi"'
+
+
+def test_last_element():
+    assert _json_element(b"[1,2,3]", (2,)) == b"3"
+    assert _json_element(b"[1,[2,3]]", (1, 1)) == b"3"
+
+
+def test_out_of_range_index():
+    with pytest.raises(IndexError):
+        _json_element(b"[1,2,3]", (3,))
+    with pytest.raises(IndexError):
+        _json_element(b"[[1],2]", (0, 1))
+
+
+def test_empty_array():
+    with pytest.raises(IndexError):
+        _json_element(b"[]", (0,))
+    with pytest.raises(IndexError):
+        _json_element(b"[1,[ ]]", (1, 0))
+
+
+def test_whitespace_between_elements():
+    assert _json_element(b"[1, 2, 3]", (2,)) == b"3"
+    assert _json_element(b"[1, [2]]", (1, 0)) == b"2"
+    assert _json_element(b'[ "a" , [ 1 , 2 ] ]', (1, 1)) == b"2"
+
+
+def test_not_an_array():
+    with pytest.raises(ValueError):
+        _json_element(b'[1,"x"]', (1, 0))
+
+
+def test_matches_json_decoding():
+    value = [["wrb.fr", "MkEWBc", json.dumps([[None, "a,b"], ["]"]]), None, "generic"]]
+    buf = json.dumps(value, separators=(",", ":")).encode()
+    assert json.loads(_json_element(buf, (0, 2))) == value[0][2]
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from google_trans2 import GoogleTranslate
+
+
+def _baseline_parse(inner, pronounce):
+    """The hand-written branches `_parse_response` is generated to replace."""
+    response = inner[1][0]
+    if len(response) == 1:
+        if len(response[0]) > 5:
+            sentences = response[0][5]
+        else:  ## only url
+            sentences = response[0][0]
+            if pronounce:
+                return [sentences, None, None]
+            return sentences
+
+        translate_text = " ".join(sentence[0].strip() for sentence in sentences)
+        if not pronounce:
+            return translate_text
+        pronounce_src = inner[0][0]
+        pronounce_tgt = response[0][1]
+        return [translate_text, pronounce_src, pronounce_tgt]
+    elif len(response) == 2:
+        sentences = []
+        for i in response:
+            sentences.append(i[0])
+        if not pronounce:
+            return sentences
+        pronounce_src = inner[0][0]
+        pronounce_tgt = response[0][1]
+        return [sentences, pronounce_src, pronounce_tgt]
+
+
+SHAPES = {
+    "sentences": [
+        ["nǐ hǎo", None, "zh-CN"],
+        [[[None, "Hello", None, None, None, [["Hello. ", None], [" World", None]]]], "en"],
+    ],
+    "url only": [
+        [None, None, "en"],
+        [[["https://example.com"]], "fr"],
+    ],
+    "two alternatives": [
+        ["src", None, "en"],
+        [[["il est", "il est"], ["elle est", "elle est"]], "fr"],
+    ],
+}
+
+
+def _payload(inner) -> bytes:
+    return json.dumps(json.dumps(inner)).encode()
+
+
+@pytest.mark.parametrize("pronounce", [False, True])
+@pytest.mark.parametrize("shape", SHAPES)
+def test_matches_baseline(shape, pronounce):
+    g = GoogleTranslate()
+    inner = SHAPES[shape]
+    assert g._parse_translation(_payload(inner), pronounce=pronounce) == _baseline_parse(
+        inner, pronounce
+    )
+
+
+def test_pronunciation_fields_are_only_read_when_requested():
+    g = GoogleTranslate()
+    inner = [[], [[["il est"], ["elle est"]], "fr"]]
+    assert g._parse_translation(_payload(inner)) == ["il est", "elle est"]
+    with pytest.raises(IndexError):
+        g._parse_translation(_payload(inner), pronounce=True)
+
+
+def test_unknown_shape_returns_none():
+    g = GoogleTranslate()
+    assert g._parse_translation(_payload([[None], [[[1], [2], [3]]]])) is None
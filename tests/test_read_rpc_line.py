@@ -0,0 +1,46 @@
+import pytest
+
+from google_trans2 import GoogleTranslate
+
+LINE = b'[["wrb.fr","MkEWBc","[[null,\\"a\\\\nb\\"]]",null,null,null,"generic"]]'
+BODY = b")]}'\n\n123\n" + LINE + b'\n58\n[["di",40],["af.httprm",39,"-1",7]]\n27\n[["e",4,null,null,1]]\n'
+
+
+def _chunks(body, size):
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 50, 10000])
+def test_finds_line_across_chunk_sizes(size):
+    g = GoogleTranslate()
+    assert g._read_rpc_line(_chunks(BODY, size)) == LINE
+
+
+@pytest.mark.parametrize("size", [1, 5, 10000])
+def test_line_at_end_of_body_without_newline(size):
+    g = GoogleTranslate()
+    assert g._read_rpc_line(_chunks(b")]}'\n\n" + LINE, size)) == LINE
+
+
+def test_missing_marker_returns_none():
+    g = GoogleTranslate()
+    assert g._read_rpc_line(_chunks(b")]}'\n\n12\n[[\"e\",4]]\n", 4)) is None
+
+
+def test_reads_every_chunk():
+    g = GoogleTranslate()
+    consumed = []
+
+    def chunks():
+        for chunk in _chunks(BODY, 16):
+            consumed.append(chunk)
+            yield chunk
+
+    g._read_rpc_line(chunks())
+    assert b"".join(consumed) == BODY
+
+
+@pytest.mark.parametrize("size", [1, 7, 10000])
+def test_matches_rpc_line(size):
+    g = GoogleTranslate()
+    assert g._read_rpc_line(_chunks(BODY, size)) == g._rpc_line(BODY)
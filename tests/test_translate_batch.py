@@ -0,0 +1,67 @@
+import pytest
+
+from google_trans2 import GoogleTranslate
+from google_trans2.constants import BATCH_MAX_CHARS, BATCH_SEPARATOR
+from google_trans2.translate import _pack_batch
+
+
+def _client(translate):
+    g = GoogleTranslate(cache_size=0)
+    calls = []
+
+    def fake(text, src_lang, tgt_lang, pronounce):
+        calls.append(text)
+        return translate(text)
+
+    g._translate = fake
+    return g, calls
+
+
+def test_joins_texts_into_one_request():
+    g, calls = _client(str.upper)
+    assert g.translate_batch(["file", "edit", "view"]) == ["FILE", "EDIT", "VIEW"]
+    assert calls == [BATCH_SEPARATOR.join(["file", "edit", "view"])]
+
+
+def test_separator_with_extra_whitespace_still_splits():
+    g, calls = _client(lambda text: text.upper().replace("\n", " \n  "))
+    assert g.translate_batch(["file", "edit"]) == ["FILE", "EDIT"]
+    assert len(calls) == 1
+
+
+def test_mangled_separator_falls_back_to_one_request_per_text():
+    g, calls = _client(lambda text: text.upper().replace("\u2063", ""))
+    assert g.translate_batch(["file", "edit", "view"]) == ["FILE", "EDIT", "VIEW"]
+    assert calls[1:] == ["file", "edit", "view"]
+
+
+def test_blank_texts_keep_their_position():
+    g, calls = _client(str.upper)
+    assert g.translate_batch(["", "file", "  ", "edit", "\n"]) == [
+        "",
+        "FILE",
+        "",
+        "EDIT",
+        "",
+    ]
+    assert calls == [BATCH_SEPARATOR.join(["file", "edit"])]
+
+
+def test_only_blank_texts_make_no_requests():
+    g, calls = _client(str.upper)
+    assert g.translate_batch(["", " "]) == ["", ""]
+    assert calls == []
+
+
+def test_pack_batch_respects_the_size_limit():
+    texts = [(i, "x" * 1000) for i in range(10)]
+    chunks = list(_pack_batch(texts))
+    assert [i for chunk in chunks for i, _ in chunk] == list(range(10))
+    for chunk in chunks:
+        assert len(BATCH_SEPARATOR.join(t for _, t in chunk)) <= BATCH_MAX_CHARS
+
+
+@pytest.mark.parametrize("length", [BATCH_MAX_CHARS, BATCH_MAX_CHARS + 100])
+def test_pack_batch_keeps_long_texts_alone(length):
+    chunks = list(_pack_batch([(0, "a"), (1, "x" * length), (2, "b")]))
+    assert [[i for i, _ in chunk] for chunk in chunks] == [[0], [1], [2]]
@@ -0,0 +1,58 @@
+import asyncio
+import json
+from urllib.parse import unquote
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from google_trans2 import GoogleTranslate
+from google_trans2.exceptions import GoogleTranslateError
+
+
+def _request_text(body: bytes) -> str:
+    rpc = json.loads(unquote(body.decode()[len("f.req=") : -1]))
+    return json.loads(rpc[0][0][1])[0][0]
+
+
+def _run(texts, rpc_body, sentences_inner, client=None):
+    requests = []
+
+    async def handler(request):
+        text = _request_text(await request.read())
+        requests.append(text)
+        if text == "bad":
+            return web.Response(status=403)
+        return web.Response(body=rpc_body(sentences_inner(text.upper())))
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/", handler)
+        async with TestServer(app) as server:
+            g = client or GoogleTranslate()
+            g.url = str(server.make_url("/"))
+            return await g.translate_many(texts, target_lang="fr")
+
+    return asyncio.run(main()), requests
+
+
+def test_results_keep_input_order(rpc_body, sentences_inner):
+    results, _ = _run(["one", "two", "three"], rpc_body, sentences_inner)
+    assert results == ["ONE", "TWO", "THREE"]
+
+
+def test_failure_does_not_discard_other_results(rpc_body, sentences_inner):
+    results, _ = _run(["one", "bad", "three"], rpc_body, sentences_inner)
+    assert results[0] == "ONE" and results[2] == "THREE"
+    assert isinstance(results[1], GoogleTranslateError)
+
+
+def test_uses_the_translate_cache(rpc_body, sentences_inner):
+    g = GoogleTranslate()
+    _, requests = _run(["one", "two"], rpc_body, sentences_inner, client=g)
+    results, requests = _run(["one", "two", "new"], rpc_body, sentences_inner, client=g)
+    assert results == ["ONE", "TWO", "NEW"]
+    assert requests == ["new"]